@@ -37,6 +37,7 @@ EMAIL_SMTP_SERVER = os.getenv("EMAIL_SMTP_SERVER", "smtp.example.com")
 EMAIL_SMTP_PORT = 587
 EMAIL_FROM_ADDRESS = "noreply@ecommerce.example.com"
 EMAIL_USE_TLS = True
+NOTIFICATION_MAX_CONCURRENCY = 20
 
 # ── Security ──
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "change-me-in-production")
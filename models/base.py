@@ -21,8 +21,9 @@ class BaseModel:
 
     def __init__(self, id: Optional[str] = None):
         self.id = id or uuid4().hex
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.created_at = now
+        self.updated_at = now
 
     def hash_password(self, password: str) -> str:
         """
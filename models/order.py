@@ -8,8 +8,8 @@ is called AFTER Step 1 (input sanitization in api/checkout.py).
 
 from datetime import datetime
 from enum import Enum
+from secrets import token_hex
 from typing import Dict, Any, List
-from uuid import uuid4
 
 from config.settings import TAX_RATE, MAX_ORDER_AMOUNT, MIN_ORDER_AMOUNT
 
@@ -35,7 +35,7 @@ class OrderItem:
         if unit_price < 0:
             raise ValueError(f"Unit price cannot be negative, got {unit_price}")
 
-        self.item_id = uuid4().hex[:8]
+        self.item_id = token_hex(4)
         self.product_id = product_id
         self.product_name = product_name
         self.quantity = quantity
@@ -68,7 +68,7 @@ class Order:
     def __init__(
         self, user_id: str, items: List[OrderItem], shipping_address: Dict[str, str]
     ):
-        self.order_id = f"ORD-{uuid4().hex[:10].upper()}"
+        self.order_id = f"ORD-{token_hex(5).upper()}"
         self.user_id = user_id
         self.items = items
         self.shipping_address = shipping_address
@@ -8,8 +8,8 @@ service to maintain data integrity.
 
 import asyncio
 from datetime import datetime, timedelta
+from secrets import token_hex
 from typing import Dict, Any, Tuple
-from uuid import uuid4
 
 from config.settings import RESERVATION_TIMEOUT_MINUTES
 from utils.logger import log_info, log_inventory_change
@@ -39,16 +39,16 @@ async def reserve_stock(
                 f"Available: {current_stock}"
             )
 
-        reservation_id = f"RSV-{uuid4().hex[:8]}"
+        reservation_id = f"RSV-{token_hex(4)}"
+        now = datetime.utcnow()
         _stock[product_id] = current_stock - quantity
         _reservations[reservation_id] = {
             "reservation_id": reservation_id,
             "product_id": product_id,
             "quantity": quantity,
             "order_id": order_id,
-            "created_at": datetime.utcnow(),
-            "expires_at": datetime.utcnow()
-            + timedelta(minutes=RESERVATION_TIMEOUT_MINUTES),
+            "created_at": now,
+            "expires_at": now + timedelta(minutes=RESERVATION_TIMEOUT_MINUTES),
             "confirmed": False,
         }
 
@@ -5,8 +5,9 @@ Depends on message_formatter for building notification content.
 """
 
 import asyncio
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 
+from config.settings import NOTIFICATION_MAX_CONCURRENCY
 from services.message_formatter import format_order_confirmation, format_shipping_update
 from utils.logger import log_info, log_error
 
@@ -15,6 +16,13 @@ class NotificationError(Exception):
     pass
 
 
+# ── Formatter dispatch table, keyed by notification_type ──
+_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "order_confirmation": format_order_confirmation,
+    "shipping_update": format_shipping_update,
+}
+
+
 async def send_notification(
     recipient_email: str,
     notification_type: str,
@@ -29,17 +37,16 @@ async def send_notification(
         data: Notification payload data
     """
     try:
-        if notification_type == "order_confirmation":
-            message = format_order_confirmation(data)
-        elif notification_type == "shipping_update":
-            message = format_shipping_update(data)
-        else:
+        formatter = _FORMATTERS.get(notification_type)
+        if formatter is None:
             raise NotificationError(
                 f"Unknown notification type: {notification_type}"
             )
+        message = formatter(data)
 
         log_info(
-            message=f"Sending {notification_type} to {recipient_email}",
+            message="Sending %s to %s",
+            args=(notification_type, recipient_email),
             transaction_id=data.get("order_id", "unknown"),
         )
 
@@ -60,13 +67,31 @@ async def send_bulk_notifications(
     notifications: List[Dict[str, Any]],
 ) -> Dict[str, int]:
     """Send multiple notifications, returns success/failure counts."""
+    # Read every entry before creating any coroutine, so a malformed entry
+    # raises without leaving already-created sends unawaited.
+    requests = [
+        (notif["email"], notif["type"], notif["data"])
+        for notif in notifications
+    ]
+    semaphore = asyncio.Semaphore(NOTIFICATION_MAX_CONCURRENCY)
+
+    async def _send_limited(
+        email: str, notification_type: str, data: Dict[str, Any]
+    ) -> bool:
+        async with semaphore:
+            return await send_notification(email, notification_type, data)
+
+    outcomes = await asyncio.gather(
+        *(_send_limited(*request) for request in requests),
+        return_exceptions=True,
+    )
+
     results = {"sent": 0, "failed": 0}
-    for notif in notifications:
-        try:
-            await send_notification(
-                notif["email"], notif["type"], notif["data"]
-            )
-            results["sent"] += 1
-        except NotificationError:
+    for outcome in outcomes:
+        if isinstance(outcome, NotificationError):
             results["failed"] += 1
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results["sent"] += 1
     return results
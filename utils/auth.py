@@ -15,13 +15,12 @@ from config.settings import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRY_HOURS
 
 def generate_token(user_id: str, role: str) -> str:
     """Generate a JWT-like authentication token."""
+    now = datetime.utcnow()
     payload = {
         "user_id": user_id,
         "role": role,
-        "issued_at": datetime.utcnow().isoformat(),
-        "expires_at": (
-            datetime.utcnow() + timedelta(hours=JWT_EXPIRY_HOURS)
-        ).isoformat(),
+        "issued_at": now.isoformat(),
+        "expires_at": (now + timedelta(hours=JWT_EXPIRY_HOURS)).isoformat(),
     }
     token_data = f"{user_id}:{role}:{payload['expires_at']}"
     signature = hmac.new(
@@ -7,12 +7,16 @@ CRUD operations for orders, users, and products.
 
 import asyncio
 from datetime import datetime
+from secrets import token_hex
 from typing import Dict, Any, List, Optional
-from uuid import uuid4
 
 
 _db_lock = asyncio.Lock()
 
+_VALID_ORDER_STATUSES = frozenset(
+    ("pending", "processing", "paid", "shipped", "delivered", "cancelled")
+)
+
 
 # ── Data Schemas ──
 # These Dict schemas define the expected data shape for each entity.
@@ -68,7 +72,7 @@ async def save_order(order_data: Dict[str, Any]) -> str:
         raise ValueError(f"Invalid order data: {'; '.join(errors)}")
 
     async with _db_lock:
-        order_id = f"ORD-{uuid4().hex[:10].upper()}"
+        order_id = f"ORD-{token_hex(5).upper()}"
         order_data["id"] = order_id
         order_data["created_at"] = datetime.utcnow().isoformat()
         # In production: await db.orders.insert_one(order_data)
@@ -102,11 +106,7 @@ async def update_inventory(product_id: str, quantity_change: int) -> bool:
 
 async def update_order_status(order_id: str, status: str) -> bool:
     """Update the status of an order."""
-    valid_statuses = [
-        "pending", "processing", "paid",
-        "shipped", "delivered", "cancelled",
-    ]
-    if status not in valid_statuses:
+    if status not in _VALID_ORDER_STATUSES:
         raise ValueError(f"Invalid status: {status}")
     # In production: await db.orders.update_one(...)
     return True
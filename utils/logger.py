@@ -8,7 +8,7 @@ All log entries are formatted as JSON for easy parsing.
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 logger = logging.getLogger("ecommerce")
@@ -41,8 +41,18 @@ def log_info(
     message: str,
     transaction_id: str,
     extra: Optional[Dict] = None,
+    args: Tuple = (),
 ):
-    """Log an informational event."""
+    """
+    Log an informational event.
+
+    If args is given, message is treated as a %-style format string and
+    is only interpolated when INFO logging is enabled.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if args:
+        message = message % args
     entry = _build_entry("INFO", message, transaction_id, extra)
     logger.info(json.dumps(entry))
 
@@ -53,6 +63,8 @@ def log_warning(
     extra: Optional[Dict] = None,
 ):
     """Log a warning event."""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     entry = _build_entry("WARNING", message, transaction_id, extra)
     logger.warning(json.dumps(entry))
 
@@ -65,6 +77,8 @@ def log_transaction(
     payment_method: str,
 ):
     """Log a financial transaction."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     entry = {
         "level": "INFO",
         "event": "transaction",
@@ -86,6 +100,8 @@ def log_inventory_change(
     transaction_id: Optional[str] = None,
 ):
     """Log inventory changes for audit trail."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     entry = {
         "level": "INFO",
         "event": "inventory_change",